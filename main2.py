@@ -1,8 +1,29 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
+import tkinter.font as tkfont
 import serial, serial.tools.list_ports
 import json, math, os, time
-import copy
+import array, queue, struct, threading
+from pathlib import Path
+
+# orjson is optional; it parses and serializes several times faster than the stdlib json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+json_loads = orjson.loads if orjson else json.loads
+
+if orjson:
+    json_dumps = orjson.dumps
+else:
+    def json_dumps(obj):
+        return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+# Pillow is optional; with it each knob body is pre-rendered to a single image
+try:
+    from PIL import Image, ImageDraw, ImageTk
+except ImportError:
+    Image = None
 
 # MOD: Import SerialException for more specific error handling
 from serial.serialutil import SerialException
@@ -11,10 +32,24 @@ from serial.serialutil import SerialException
 # For this example, it's included here.
 DRUM_PARTS = ["Kick", "Snare", "HiHat", "Cymbal", "Tom1", "Tom2", "Tom3", "Perc1", "Perc2"]
 PATTERN_COLS = 16
-drum_pattern_array = [[0] * PATTERN_COLS for _ in range(len(DRUM_PARTS))]
+_DRUM_PART_INDEX = {part: i for i, part in enumerate(DRUM_PARTS)}
+# Drum pattern grid geometry in pixels: part label column width and cell pitch
+DRUM_LABEL_W = 60
+DRUM_CELL = 20
+# One 16-bit step mask per drum part; bit N is set when step N+1 plays
+drum_pattern_array = array.array("H", [0] * len(DRUM_PARTS))
+
+# Sine/cosine per whole degree; knob drawing only ever needs integer angles
+_SIN = [math.sin(math.radians(i)) for i in range(360)]
+_COS = [math.cos(math.radians(i)) for i in range(360)]
 
 # ── MetallicKnob Widget ─────────────────────────────────────
 class MetallicKnob(tk.Canvas):
+    # Geometry that depends only on the knob size, shared by all knobs of that size
+    _static_cache = {}
+    # Pre-rendered knob bodies per size; holding them here also keeps Tk images alive
+    _body_image_cache = {}
+
     def __init__(self, master, size=80, min_value=0, max_value=100, label="Knob", **kwargs):
         # Get parent background color and set canvas background to match
         parent_bg = master.cget('bg') if hasattr(master, 'cget') else "#333333"
@@ -27,8 +62,12 @@ class MetallicKnob(tk.Canvas):
         self.max_value = max_value
         self.label_text = label
         self.value = min_value
+        # Displayed (integer) value, kept in step with self.value
+        self._int_value = int(min_value)
         self.last_y = None
         self.change_callback = None
+        self._drag_pending = False
+        self._geometry = self._get_static_geometry(size)
         self._draw_static_elements()
         self._draw_dynamic_elements()
         self.bind("<Button-1>", self._start_drag)
@@ -36,47 +75,126 @@ class MetallicKnob(tk.Canvas):
         self.bind("<ButtonRelease-1>", self._on_release)
         self._update_needle()
 
-    def _draw_static_elements(self):
+    @classmethod
+    def _get_static_geometry(cls, size):
+        """Return the cached static drawing data for knobs of the given size"""
+        geometry = cls._static_cache.get(size)
+        if geometry is not None:
+            return geometry
+
         # Offset all knob elements down by 20 pixels to make room for label
         offset_y = 20
-        
+        center = size // 2
+        radius = size // 2 - 12
+
+        shadows = []
         for i in range(8):
             gray = 48 + int(170 * (i / 7))
             color = f"#{gray:02x}{gray:02x}{gray:02x}"
-            self.create_oval(8 + i, 8 + i + offset_y, self.size - 8 - i, self.size - 8 - i + offset_y, fill=color, outline="")
-
-        self.create_oval(6, 6 + offset_y, self.size - 6, self.size - 6 + offset_y, outline="#cfcfd4", width=2)
-        self.create_oval(10, 10 + offset_y, self.size - 10, self.size - 10 + offset_y, outline="#949491", width=1)
+            shadows.append((8 + i, 8 + i + offset_y, size - 8 - i, size - 8 - i + offset_y, color))
 
+        ticks = []
         for t in range(0, 360, 18):
-            rad = math.radians(t)
-            x1 = self.center + (self.radius + 2) * math.sin(rad)
-            y1 = self.center + (self.radius + 2) * math.cos(rad) + offset_y
-            x2 = self.center + (self.radius - 4) * math.sin(rad)
-            y2 = self.center + (self.radius - 4) * math.cos(rad) + offset_y
+            s, c = _SIN[t], _COS[t]
+            x1 = center + (radius + 2) * s
+            y1 = center + (radius + 2) * c + offset_y
+            x2 = center + (radius - 4) * s
+            y2 = center + (radius - 4) * c + offset_y
             color = "#eaeaf7" if t % 36 == 0 else "#aaa"
-            self.create_line(x1, y1, x2, y2, fill=color, width=1)
+            ticks.append((x1, y1, x2, y2, color))
+
+        geometry = {
+            "shadows": shadows,
+            "outer_bezel": (6, 6 + offset_y, size - 6, size - 6 + offset_y),
+            "inner_bezel": (10, 10 + offset_y, size - 10, size - 10 + offset_y),
+            "ticks": ticks,
+            "rim": (18, 18 + offset_y, size - 18, size - 18 + offset_y),
+            "hub": (center - 6, center - 6 + offset_y, center + 6, center + 6 + offset_y),
+            "hub_shine": (center - 3, center - 4 + offset_y, center + 3, center - 1 + offset_y),
+            # Needle polygons indexed by whole degree, filled lazily
+            "needles": {},
+        }
+        cls._static_cache[size] = geometry
+        return geometry
+
+    @classmethod
+    def _get_body_image(cls, size):
+        """Return the knob body rendered as one image, or None without Pillow"""
+        if Image is None:
+            return None
+        image = cls._body_image_cache.get(size)
+        if image is None:
+            image = ImageTk.PhotoImage(cls._render_body(size))
+            cls._body_image_cache[size] = image
+        return image
+
+    @classmethod
+    def _render_body(cls, size):
+        # Drawn at 4x and scaled down, which smooths the edges
+        scale = 4
+        geometry = cls._get_static_geometry(size)
+        img = Image.new("RGBA", (size * scale, (size + 25) * scale), (0, 0, 0, 0))
+        draw = ImageDraw.Draw(img)
+
+        def scaled(coords):
+            return [c * scale for c in coords]
+
+        for x1, y1, x2, y2, color in geometry["shadows"]:
+            draw.ellipse(scaled((x1, y1, x2, y2)), fill=color)
+
+        draw.ellipse(scaled(geometry["outer_bezel"]), outline="#cfcfd4", width=2 * scale)
+        draw.ellipse(scaled(geometry["inner_bezel"]), outline="#949491", width=scale)
+
+        for x1, y1, x2, y2, color in geometry["ticks"]:
+            draw.line(scaled((x1, y1, x2, y2)), fill=color, width=scale)
+
+        draw.ellipse(scaled(geometry["rim"]), outline="#111", width=2 * scale)
+        draw.ellipse(scaled(geometry["hub"]), fill="#b8b9be", outline="#eaeaf7", width=scale)
+
+        # Drawing on an RGBA image replaces pixels, so the translucent shine is
+        # drawn on its own layer and composited to blend it over the hub
+        shine = Image.new("RGBA", img.size, (0, 0, 0, 0))
+        ImageDraw.Draw(shine).ellipse(scaled(geometry["hub_shine"]), fill=(255, 255, 255, 64))
+        img = Image.alpha_composite(img, shine)
+
+        return img.resize((size, size + 25), Image.LANCZOS)
 
-        self.create_oval(18, 18 + offset_y, self.size - 18, self.size - 18 + offset_y, outline="#111", width=2)
-        self.create_oval(self.center-6, self.center-6 + offset_y, self.center+6, self.center+6 + offset_y,
-                        fill="#b8b9be", outline="#eaeaf7", width=1)
-        self.create_oval(self.center-3, self.center-4 + offset_y, self.center+3, self.center-1 + offset_y,
-                        fill="#fff", outline="", stipple="gray25")
+    def _draw_static_elements(self):
+        body = self._get_body_image(self.size)
+        if body is not None:
+            self.create_image(0, 0, anchor="nw", image=body)
+        else:
+            self._draw_static_vectors()
         
         # Label positioned at top of canvas with proper margin
         self.label_master = self.create_text(self.center, 10, text=self.label_text, 
-                                           font=("Segoe UI", 16, "bold"), fill="#fff")
+                                           font=KNOB_LABEL_FONT, fill="#fff")
+
+    def _draw_static_vectors(self):
+        geometry = self._geometry
+
+        for x1, y1, x2, y2, color in geometry["shadows"]:
+            self.create_oval(x1, y1, x2, y2, fill=color, outline="")
+
+        self.create_oval(*geometry["outer_bezel"], outline="#cfcfd4", width=2)
+        self.create_oval(*geometry["inner_bezel"], outline="#949491", width=1)
+
+        for x1, y1, x2, y2, color in geometry["ticks"]:
+            self.create_line(x1, y1, x2, y2, fill=color, width=1)
+
+        self.create_oval(*geometry["rim"], outline="#111", width=2)
+        self.create_oval(*geometry["hub"], fill="#b8b9be", outline="#eaeaf7", width=1)
+        self.create_oval(*geometry["hub_shine"], fill="#fff", outline="", stipple="gray25")
 
     def _draw_dynamic_elements(self):
         offset_y = 20
         angle = self._value_to_angle(self.value)
         needle_shape = self._create_needle_shape(angle, offset_y)
-        self.needle_glow = self.create_polygon(needle_shape, fill="#fc7070", outline="", width=0)
+        # A single needle item keeps drag updates to one coords() call
         self.needle = self.create_polygon(needle_shape, fill="#ff1212", outline="#fff", width=1)
-        self.reflection = self.create_polygon(needle_shape, fill="#fff", outline="", stipple="gray12")
         # Value label with offset
         self.value_label = self.create_text(self.center, self.center + self.radius // 2 + offset_y,
-                                          text=str(int(self.value)), font=("Segoe UI", 18, "bold"), fill="#ed3c3c")
+                                          text=str(int(self.value)), font=KNOB_VALUE_FONT, fill="#ed3c3c")
 
     def _start_drag(self, event):
         self.last_y = event.y
@@ -91,6 +209,15 @@ class MetallicKnob(tk.Canvas):
         sensitivity = 0.5
         new_value = self.value + (dy * sensitivity)
         self.value = max(self.min_value, min(self.max_value, new_value))
+        self._int_value = int(self.value)
+        
+        # Redraw at most once per idle tick, however fast motion events arrive
+        if not self._drag_pending:
+            self._drag_pending = True
+            self.after_idle(self._flush_drag)
+
+    def _flush_drag(self):
+        self._drag_pending = False
         self._update_needle()
         self.itemconfig(self.value_label, text=str(int(self.value)))
         
@@ -111,38 +238,52 @@ class MetallicKnob(tk.Canvas):
         return 180 + ((value - self.min_value) * 360.0) / (self.max_value - self.min_value)
 
     def _create_needle_shape(self, angle_degrees=180, offset_y=0):
-        rad = math.radians(angle_degrees)
+        # The needle only needs whole-degree resolution, so shapes are looked up per degree
+        degree = int(angle_degrees) % 360
+        needles = self._geometry["needles"]
+        key = (degree, offset_y)
+        shape = needles.get(key)
+        if shape is not None:
+            return shape
+
         center_y = self.center + offset_y
-        tip_x = self.center + self.radius * math.sin(rad)
-        tip_y = center_y - self.radius * math.cos(rad)
-        base_rad_l = math.radians(angle_degrees - 8)
-        base_xl = self.center + 8 * math.sin(base_rad_l)
-        base_yl = center_y - 8 * math.cos(base_rad_l)
-        base_rad_r = math.radians(angle_degrees + 8)
-        base_xr = self.center + 8 * math.sin(base_rad_r)
-        base_yr = center_y - 8 * math.cos(base_rad_r)
-        return [base_xl, base_yl, tip_x, tip_y, base_xr, base_yr, self.center, center_y]
+        tip_x = self.center + self.radius * _SIN[degree]
+        tip_y = center_y - self.radius * _COS[degree]
+        base_l = (degree - 8) % 360
+        base_xl = self.center + 8 * _SIN[base_l]
+        base_yl = center_y - 8 * _COS[base_l]
+        base_r = (degree + 8) % 360
+        base_xr = self.center + 8 * _SIN[base_r]
+        base_yr = center_y - 8 * _COS[base_r]
+        shape = (base_xl, base_yl, tip_x, tip_y, base_xr, base_yr, self.center, center_y)
+        needles[key] = shape
+        return shape
 
     def _update_needle(self):
         offset_y = 20
         angle = self._value_to_angle(self.value)
         shape = self._create_needle_shape(angle, offset_y)
-        shape_glow = [c + (1 if i == 2 else 0) if i % 2 == 0 else c + (1 if i == 3 else 0) for i, c in enumerate(shape)]
-        self.coords(self.needle_glow, *shape_glow)
         self.coords(self.needle, *shape)
-        shape_reflection = [c - 1 for c in shape]
-        self.coords(self.reflection, *shape_reflection)
 
     def get_value(self):
         return self.value
 
+    @property
+    def int_value(self):
+        """Displayed value as an int, updated whenever the knob moves"""
+        return self._int_value
+
     def set_value(self, value):
         self.value = max(self.min_value, min(self.max_value, value))
+        self._int_value = int(self.value)
         self._update_needle()
         self.itemconfig(self.value_label, text=str(int(self.value)))
 
 # ── ScrollableFrame Widget for horizontal scrolling ─────────────────
 class ScrollableFrame(tk.Frame):
+    # Frames that receive wheel events from the shared application-wide binding
+    _wheel_targets = []
+
     def __init__(self, parent, *args, **kwargs):
         super().__init__(parent, *args, **kwargs)
         
@@ -151,50 +292,92 @@ class ScrollableFrame(tk.Frame):
         self.scrollbar = ttk.Scrollbar(self, orient="horizontal", command=self.canvas.xview)
         self.scrollable_frame = tk.Frame(self.canvas, bg="#333333")
         
-        self.scrollable_frame.bind(
-            "<Configure>",
-            lambda e: self.canvas.configure(scrollregion=self.canvas.bbox("all"))
-        )
+        # Wheel steps accumulated until the next idle tick
+        self._wheel_units = 0
+        self._wheel_pending = False
+        
+        # Scroll region is recomputed at most once per idle tick
+        self._scrollregion_pending = False
+        self.scrollable_frame.bind("<Configure>", self._mark_scrollregion_dirty)
         
         self.canvas.create_window((0, 0), window=self.scrollable_frame, anchor="nw")
         self.canvas.configure(xscrollcommand=self.scrollbar.set)
         
         # Horizontal scrolling with mouse wheel when mouse is over effects area
-        self._bind_mousewheel()
+        self._register_mousewheel()
         
         self.canvas.pack(side="top", fill="both", expand=True)
         self.scrollbar.pack(side="bottom", fill="x")
     
-    def _bind_mousewheel(self):
-        """Bind mouse wheel events for horizontal scrolling"""
-        self.canvas.bind("<Enter>", self._on_enter)
-        self.canvas.bind("<Leave>", self._on_leave)
-        
-    def _on_enter(self, event):
-        """Enable horizontal mouse wheel scrolling when mouse enters"""
-        self.canvas.bind_all("<MouseWheel>", self._on_mousewheel)
-        self.canvas.bind_all("<Button-4>", self._on_mousewheel)
-        self.canvas.bind_all("<Button-5>", self._on_mousewheel)
-        
-    def _on_leave(self, event):
-        """Disable horizontal mouse wheel scrolling when mouse leaves"""
-        self.canvas.unbind_all("<MouseWheel>")
-        self.canvas.unbind_all("<Button-4>")
-        self.canvas.unbind_all("<Button-5>")
+    def _mark_scrollregion_dirty(self, event=None):
+        if not self._scrollregion_pending:
+            self._scrollregion_pending = True
+            self.after_idle(self._update_scrollregion)
+
+    def _update_scrollregion(self):
+        self._scrollregion_pending = False
+        self.canvas.configure(scrollregion=self.canvas.bbox("all"))
+
+    def _register_mousewheel(self):
+        """Route mouse wheel events to this frame, binding them once per application"""
+        if not ScrollableFrame._wheel_targets:
+            for sequence in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+                self.bind_all(sequence, ScrollableFrame._route_mousewheel, add="+")
+        ScrollableFrame._wheel_targets.append(self)
+
+    def destroy(self):
+        if self in ScrollableFrame._wheel_targets:
+            ScrollableFrame._wheel_targets.remove(self)
+        super().destroy()
+
+    @classmethod
+    def _route_mousewheel(cls, event):
+        """Forward a wheel event to the scrollable frame under the pointer"""
+        if not cls._wheel_targets:
+            return
+        try:
+            widget = cls._wheel_targets[0].winfo_containing(event.x_root, event.y_root)
+        except KeyError:
+            # Pointer is over a Tk-internal window such as a combobox popdown
+            return
+        if widget is None:
+            return
+        
+        path = str(widget)
+        for frame in cls._wheel_targets:
+            canvas_path = str(frame.canvas)
+            if path == canvas_path or path.startswith(canvas_path + "."):
+                frame._on_mousewheel(event)
+                return
         
     def _on_mousewheel(self, event):
         # Handle horizontal mouse wheel scrolling
         if event.delta:
-            self.canvas.xview_scroll(int(-1 * (event.delta / 120)), "units")
+            self._wheel_units += int(-1 * (event.delta / 120))
         elif event.num == 4:
-            self.canvas.xview_scroll(-1, "units")
+            self._wheel_units -= 1
         elif event.num == 5:
-            self.canvas.xview_scroll(1, "units")
+            self._wheel_units += 1
+        
+        if not self._wheel_pending:
+            self._wheel_pending = True
+            self.after_idle(self._flush_mousewheel)
+
+    def _flush_mousewheel(self):
+        self._wheel_pending = False
+        units, self._wheel_units = self._wheel_units, 0
+        if units:
+            self.canvas.xview_scroll(units, "units")
 
 # ── App Constants ─────────────────────────────────────
 STATE_FILE = "jam_state.json"
 PRESETS_FILE = "presets.json"
 DEVICE_NAME = "JamMate_BL"
+_DEVICE_NAME_UC = DEVICE_NAME.upper()
+# 17-byte packets start with a 4-byte ASCII header; unused bytes are zero
+DRMP_PACKET = struct.Struct("<4s7x3H")  # 7 zero bytes, then Snare, HiHat, Kick step masks at bytes 11-16
+DEBUG = False  # Echo status messages to stdout
+SEND_INTERVAL_MS = 20  # Pending packets are flushed to the port at most this often
 
 BG = "#222222"
 PANEL = "#333333"
@@ -204,22 +387,54 @@ GREEN = "#66ff66"  # Lighter green color
 ORANGE = "#FFA500"
 RED = "#FF4444"
 
+# Named fonts: created once by set_dark_theme, then referenced by name so Tk
+# resolves them from its font table instead of parsing a tuple per widget
+TINY_FONT = "JamTinyFont"
+SMALL_FONT = "JamSmallFont"
+BUTTON_FONT = "JamButtonFont"
+UI_FONT = "JamUIFont"
+LARGE_FONT = "JamLargeFont"
+TITLE_FONT = "JamTitleFont"
+DISPLAY_FONT = "JamDisplayFont"
+KNOB_LABEL_FONT = "JamKnobLabelFont"
+KNOB_VALUE_FONT = "JamKnobValueFont"
+_named_fonts = {}
+
+# Shared options for the large top bar buttons and the looper transport buttons
+TOPBAR_BTN_KW = dict(font=BUTTON_FONT, width=8, height=3)
+TRANSPORT_BTN_KW = dict(font=UI_FONT, width=12, height=2)
+
+def create_named_fonts(root: tk.Tk):
+    # Tk deletes a named font when its Font object is collected, so keep them
+    for name, size, weight in ((TINY_FONT, 8, "normal"),
+                               (SMALL_FONT, 10, "normal"),
+                               (BUTTON_FONT, 12, "normal"),
+                               (UI_FONT, 14, "normal"),
+                               (LARGE_FONT, 16, "normal"),
+                               (TITLE_FONT, 18, "normal"),
+                               (DISPLAY_FONT, 48, "normal"),
+                               (KNOB_LABEL_FONT, 16, "bold"),
+                               (KNOB_VALUE_FONT, 18, "bold")):
+        if name not in _named_fonts:
+            _named_fonts[name] = tkfont.Font(root, name=name, family="Segoe UI", size=size, weight=weight)
+
 def set_dark_theme(root: tk.Tk):
     root.configure(bg=BG)
+    create_named_fonts(root)
     style = ttk.Style(root)
     style.theme_use("clam")
     
     style.configure("TFrame", background=PANEL)
-    style.configure("TLabel", background=PANEL, foreground=FG, font=("Segoe UI", 14))
+    style.configure("TLabel", background=PANEL, foreground=FG, font=UI_FONT)
     style.configure("TButton", background=ACCENT, foreground="#000",
-                   font=("Segoe UI", 14), padding=6, relief="flat")
+                   font=UI_FONT, padding=6, relief="flat")
     style.map("TButton", background=[("active", "#009090"), ("disabled", "#555")])
     
     style.configure("TCheckbutton", background=PANEL, foreground=FG,
-                   font=("Segoe UI", 14))
+                   font=UI_FONT)
     
     style.configure("Large.TCombobox",
-                   font=("Segoe UI", 16),
+                   font=LARGE_FONT,
                    fieldbackground="#444",
                    selectbackground=ACCENT,
                    foreground=FG,
@@ -230,39 +445,82 @@ def set_dark_theme(root: tk.Tk):
               selectbackground=[("readonly", ACCENT)],
               foreground=[("readonly", FG)])
 
-    root.option_add("*TCombobox*Listbox.font", ("Segoe UI", 14))
+    root.option_add("*TCombobox*Listbox.font", UI_FONT)
     root.option_add("*TCombobox*Listbox.background", "#444")
     root.option_add("*TCombobox*Listbox.foreground", FG)
     root.option_add("*TCombobox*Listbox.selectBackground", ACCENT)
     root.option_add("*TCombobox*Listbox.selectForeground", "#000")
 
+def write_json_atomic(path, data):
+    # Write a temporary file and swap it in, so a crash mid-write never
+    # leaves a truncated file behind
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(json_dumps(data))
+    os.replace(tmp_path, path)
+
+def set_low_latency(port: serial.Serial):
+    # USB-serial drivers batch incoming bytes for up to 16 ms by default;
+    # ASYNC_LOW_LATENCY makes them deliver immediately. pyserial only offers
+    # this on POSIX, and some drivers refuse it, so failures are ignored.
+    if not hasattr(port, "set_low_latency_mode"):
+        return
+    try:
+        port.set_low_latency_mode(True)
+    except (OSError, ValueError):
+        pass
+
 class GuitarFXApp(tk.Tk):
     def __init__(self):
         super().__init__()
+        # Cleared in _on_close; cheaper than a winfo_exists() round trip to Tcl
+        self._alive = True
         self.title("JamMate_BL Effects Controller")
         # FIXED: Changed to proper phone portrait aspect ratio
         self.geometry("390x844")  # iPhone 12 Pro dimensions for realistic phone size
         set_dark_theme(self)
         
+        # Latest packet per header, written out together by _flush_serial
         self.pending_send = {}
+        self.send_job = None
+        # Pending DRMP send; a burst of grid toggles becomes one pattern packet
+        self.drmp_job = None
+        # Outgoing data for the serial writer thread, created per connection
+        self.tx_queue = None
         
         # Create all effects including special ones
         self.all_effects = self._create_all_effects()
         
         self.presets = self._load_presets()
+        self._index_presets()
+        self.save_presets_job = None
         self.DrumPatEnab = 0
         self.serial_port = None
         self.bt_connected = False
         self.is_connecting = False
-        self.connection_check_job = None
+        # Set to stop the serial worker threads of the current connection
+        self.serial_stop = threading.Event()
         self.tab_state = self._load_state()
         self.current_effect = None
         self.effect_widgets = {}
+        # Effect panels are built on first selection and kept for reuse
+        self.effect_panels = {}
+        # Content builders for the special modules; other types are regular effects
+        self.panel_builders = {
+            "drum": self._build_drum_content,
+            "metronome": self._build_metronome_content,
+            "looper": self._build_looper_content,
+            "tuner": self._build_tuner_content,
+            "setup": self._build_setup_content,
+        }
+        self.current_panel = None
+        # Enable variables of the effects that show an enable checkbox
+        self.effect_enables = {}
         self.bypass_enabled = False
         
-        self.style_options = ["Rock", "Blues", "Jazz", "Shuffle", "Pop", "Metal", "Latin", "R&B", "Country", "Funk"]
-        self.fill_options = ["None", "x1", "x4", "x12", "x16"]
-        self.number_options = [str(i) for i in range(1, 11)]
+        self.style_options = ("Rock", "Blues", "Jazz", "Shuffle", "Pop", "Metal", "Latin", "R&B", "Country", "Funk")
+        self.fill_options = ("None", "x1", "x4", "x12", "x16")
+        self.number_options = tuple(str(i) for i in range(1, 11))
         
         # Create UI layout
         self._create_topbar()
@@ -284,18 +542,23 @@ class GuitarFXApp(tk.Tk):
         # Load regular effects from config or create defaults
         if os.path.exists("config.json"):
             try:
-                with open("config.json", "r", encoding="utf-8") as f:
-                    cfg = json.load(f)
-                regular_effects = cfg.get("tabs", [])[:16]  # Limit to 16 regular effects
+                with open("config.json", "rb") as f:
+                    cfg = json_loads(f.read())
+                # A config of the wrong shape falls back to the defaults below
+                tabs = cfg.get("tabs") if isinstance(cfg, dict) else None
+                if not isinstance(tabs, list):
+                    tabs = []
+                regular_effects = tabs[:16]  # Limit to 16 regular effects
                 
-                # Ensure all effects have 'type' key
+                # Ensure all effects have 'type' key. cfg was parsed just above and
+                # nothing else references it, so the effects are used without copying
                 for effect in regular_effects:
-                    effect_copy = copy.deepcopy(effect)
-                    if 'type' not in effect_copy:
-                        effect_copy['type'] = 'effect'
-                    all_effects.append(effect_copy)
+                    if not isinstance(effect, dict):
+                        continue
+                    effect.setdefault('type', 'effect')
+                    all_effects.append(effect)
                     
-            except:
+            except (OSError, json.JSONDecodeError, UnicodeDecodeError):
                 regular_effects = []
         
         # If no config or failed to load, create default effects
@@ -338,15 +601,14 @@ class GuitarFXApp(tk.Tk):
         self.status_led.pack()
         
         tk.Label(conn_frame, text=DEVICE_NAME, fg=ACCENT, bg=PANEL,
-                font=("Segoe UI", 10)).pack()
+                font=SMALL_FONT).pack()
         
         self.status_text = tk.Label(conn_frame, text="Disconnected", fg="#C33", bg=PANEL,
-                                   font=("Segoe UI", 8))
+                                   font=TINY_FONT)
         self.status_text.pack()
         
         self.btn_connect_toggle = tk.Button(conn_frame, text="Connect", bg=ACCENT, fg="#000",
-                                           font=("Segoe UI", 12),
-                                           command=self._toggle_connection, width=8, height=3)
+                                           command=self._toggle_connection, **TOPBAR_BTN_KW)
         self.btn_connect_toggle.pack(pady=3)
         
         # Center - Master knobs
@@ -379,8 +641,7 @@ class GuitarFXApp(tk.Tk):
         bypass_frame.pack(side="right", padx=8)
         
         self.bypass_btn = tk.Button(bypass_frame, text="BYPASS", bg="#666", fg=FG,
-                                   font=("Segoe UI", 12),
-                                   command=self._toggle_bypass, width=8, height=3)
+                                   command=self._toggle_bypass, **TOPBAR_BTN_KW)
         self.bypass_btn.pack()
 
     def _create_preset_bar(self):
@@ -394,28 +655,28 @@ class GuitarFXApp(tk.Tk):
         preset_container.pack(expand=True)
         
         # Bank dropdown
-        bank_items = ["Clean", "Crunch", "Overdrive", "Distortion", "Modulated", "Custom1", "Custom2"]
+        bank_items = ("Clean", "Crunch", "Overdrive", "Distortion", "Modulated", "Custom1", "Custom2")
         self.bank_var = tk.StringVar(value=bank_items[0])
         
         tk.Label(preset_container, text="Bank:", fg=FG, bg=PANEL, 
-                font=("Segoe UI", 16)).pack(side="left", padx=5)
+                font=LARGE_FONT).pack(side="left", padx=5)
         bank_combo = ttk.Combobox(preset_container, textvariable=self.bank_var, values=bank_items,
-                                 state="readonly", width=12, font=("Segoe UI", 16))
+                                 state="readonly", width=12, font=LARGE_FONT)
         bank_combo.pack(side="left", padx=3)
         
         # Num dropdown
-        num_items = ["1", "2", "3", "4", "5"]
+        num_items = ("1", "2", "3", "4", "5")
         self.num_var = tk.StringVar(value=num_items[0])
         
         tk.Label(preset_container, text="Num:", fg=FG, bg=PANEL, 
-                font=("Segoe UI", 16)).pack(side="left", padx=(10, 5))
+                font=LARGE_FONT).pack(side="left", padx=(10, 5))
         num_combo = ttk.Combobox(preset_container, textvariable=self.num_var, values=num_items,
-                                state="readonly", width=8, font=("Segoe UI", 16))
+                                state="readonly", width=8, font=LARGE_FONT)
         num_combo.pack(side="left", padx=3)
         
         # Update button
         update_btn = tk.Button(preset_container, text="Update Preset", command=self._on_update_preset,
-                              bg=ACCENT, fg="#000", font=("Segoe UI", 16))
+                              bg=ACCENT, fg="#000", font=LARGE_FONT)
         update_btn.pack(side="left", padx=(15, 5))
         
         bank_combo.bind("<<ComboboxSelected>>", self._on_preset_changed)
@@ -433,46 +694,62 @@ class GuitarFXApp(tk.Tk):
         
         self.effects_scroll = ScrollableFrame(scroll_container)
         self.effects_scroll.pack(fill="both", expand=True)
+        # Effect buttons are laid out in a single grid row
+        self.effects_scroll.scrollable_frame.rowconfigure(0, weight=1)
         
         self.effect_buttons = []
+        # (bg, fg) last applied to each effect button
+        self.effect_btn_colors = []
+        self.effect_checks = []
+        self.effect_enable_vars = []
         self._create_effect_buttons()
 
     def _create_effect_buttons(self):
-        for btn in self.effect_buttons:
-            btn.destroy()
-        self.effect_buttons = []
-        
-        # Create effect buttons with enable checkboxes
-        for i, effect_info in enumerate(self.all_effects):
-            # Create effect container
-            effect_container = tk.Frame(self.effects_scroll.scrollable_frame, bg="#444", relief="ridge", bd=1)
-            effect_container.pack(side="left", padx=2, pady=3, fill="y")
-            
-            # Effect button
-            btn = tk.Button(effect_container,
-                           text=effect_info["title"],
-                           width=12, height=3,
-                           bg="#555", fg=FG,
-                           font=("Segoe UI", 12),
-                           relief="raised", bd=1,
-                           command=lambda idx=i: self._select_effect(idx))
-            btn.pack(pady=2, padx=2)
-            self.effect_buttons.append(btn)
+        # The buttons are built once; later calls only refresh their text and
+        # checkbox visibility instead of destroying and recreating them
+        if not self.effect_buttons:
+            for i in range(len(self.all_effects)):
+                self._build_effect_button(i)
+        
+        for i, effect_info in enumerate(self.all_effects[:len(self.effect_buttons)]):
+            self.effect_buttons[i].configure(text=effect_info["title"])
             
-            # FIXED: Only add enable checkbox if effect has checkbox parameter set to True
+            # FIXED: Only show enable checkbox if effect has checkbox parameter set to True
+            chk = self.effect_checks[i]
             params = effect_info.get("params", {})
             if params.get("checkbox", True):  # Default to True, but respect False for setup
-                enable_var = tk.IntVar(value=1)
-                chk = ttk.Checkbutton(effect_container, text="Enable", variable=enable_var)
-                chk.pack(pady=1)
-                
+                if not chk.winfo_manager():
+                    chk.pack(pady=1)
                 # Store the enable variable
-                if not hasattr(self, 'effect_enables'):
-                    self.effect_enables = {}
-                self.effect_enables[i] = enable_var
-                
-                # Proper binding for enable change
-                enable_var.trace_add("write", lambda *_, idx=i: self._on_effect_enable_changed(idx))
+                self.effect_enables[i] = self.effect_enable_vars[i]
+            else:
+                chk.pack_forget()
+                self.effect_enables.pop(i, None)
+
+    def _build_effect_button(self, i):
+        # Create effect container
+        effect_container = tk.Frame(self.effects_scroll.scrollable_frame, bg="#444", relief="ridge", bd=1)
+        effect_container.grid(row=0, column=i, padx=2, pady=3, sticky="ns")
+        
+        # Effect button
+        btn = tk.Button(effect_container,
+                       width=12, height=3,
+                       bg="#555", fg=FG,
+                       font=BUTTON_FONT,
+                       relief="raised", bd=1,
+                       command=lambda idx=i: self._select_effect(idx))
+        btn.pack(pady=2, padx=2)
+        self.effect_buttons.append(btn)
+        self.effect_btn_colors.append(("#555", FG))
+        
+        # Enable checkbox, packed by _create_effect_buttons when the effect has one
+        enable_var = tk.IntVar(value=1)
+        chk = ttk.Checkbutton(effect_container, text="Enable", variable=enable_var)
+        self.effect_checks.append(chk)
+        self.effect_enable_vars.append(enable_var)
+        
+        # Proper binding for enable change
+        enable_var.trace_add("write", lambda *_, idx=i: self._on_effect_enable_changed(idx))
 
     def _create_main_area(self):
         # Main working area for current effect controls
@@ -481,23 +758,26 @@ class GuitarFXApp(tk.Tk):
         
         # Title for current effect
         self.current_title = tk.Label(self.main_area, text="Select an Effect", fg=ACCENT, bg=PANEL,
-                                     font=("Segoe UI", 18))
+                                     font=TITLE_FONT)
         self.current_title.pack(pady=15)
         
         # Scrollable content area for effect controls
         self.content_canvas = tk.Canvas(self.main_area, bg=PANEL, highlightthickness=0)
         self.content_scrollbar = ttk.Scrollbar(self.main_area, orient="vertical", command=self.content_canvas.yview)
         self.scrollable_content = tk.Frame(self.content_canvas, bg=PANEL)
+        # Effect panels share one grid cell; weights are set once here
+        self.scrollable_content.rowconfigure(0, weight=1)
+        self.scrollable_content.columnconfigure(0, weight=1)
         
-        self.scrollable_content.bind(
-            "<Configure>",
-            lambda e: self.content_canvas.configure(scrollregion=self.content_canvas.bbox("all"))
-        )
+        self._content_scrollregion_pending = False
+        self.scrollable_content.bind("<Configure>", self._mark_content_scrollregion_dirty)
         
         self.content_canvas.create_window((0, 0), window=self.scrollable_content, anchor="nw")
         self.content_canvas.configure(yscrollcommand=self.content_scrollbar.set)
         
         # Enable mouse wheel scrolling for main area
+        self._main_wheel_units = 0
+        self._main_wheel_pending = False
         self.content_canvas.bind("<MouseWheel>", self._on_main_mousewheel)
         self.content_canvas.bind("<Button-4>", self._on_main_mousewheel)
         self.content_canvas.bind("<Button-5>", self._on_main_mousewheel)
@@ -505,56 +785,77 @@ class GuitarFXApp(tk.Tk):
         self.content_canvas.pack(side="left", fill="both", expand=True)
         self.content_scrollbar.pack(side="right", fill="y")
 
+    def _mark_content_scrollregion_dirty(self, event=None):
+        if not self._content_scrollregion_pending:
+            self._content_scrollregion_pending = True
+            self.after_idle(self._update_content_scrollregion)
+
+    def _update_content_scrollregion(self):
+        self._content_scrollregion_pending = False
+        self.content_canvas.configure(scrollregion=self.content_canvas.bbox("all"))
+
     def _on_main_mousewheel(self, event):
         if event.delta:
-            self.content_canvas.yview_scroll(int(-1 * (event.delta / 120)), "units")
+            self._main_wheel_units += int(-1 * (event.delta / 120))
         elif event.num == 4:
-            self.content_canvas.yview_scroll(-1, "units")
+            self._main_wheel_units -= 1
         elif event.num == 5:
-            self.content_canvas.yview_scroll(1, "units")
+            self._main_wheel_units += 1
+        
+        if not self._main_wheel_pending:
+            self._main_wheel_pending = True
+            self.after_idle(self._flush_main_mousewheel)
+
+    def _flush_main_mousewheel(self):
+        self._main_wheel_pending = False
+        units, self._main_wheel_units = self._main_wheel_units, 0
+        if units:
+            self.content_canvas.yview_scroll(units, "units")
 
     def _select_effect(self, effect_idx):
         self.current_effect = effect_idx
         self._update_effect_buttons()
         
-        # Clear current content
-        for widget in self.scrollable_content.winfo_children():
-            widget.destroy()
+        # Hide the current panel instead of destroying it
+        if self.current_panel is not None:
+            self.current_panel.grid_remove()
         
         effect = self.all_effects[effect_idx]
         self.current_title.config(text=effect["title"])
         
+        panel = self.effect_panels.get(effect_idx)
+        if panel is None:
+            panel = tk.Frame(self.scrollable_content, bg=PANEL)
+            self._build_effect_panel(panel, effect)
+            self.effect_panels[effect_idx] = panel
+        panel.grid(row=0, column=0, sticky="nsew")
+        self.current_panel = panel
+
+    def _build_effect_panel(self, parent, effect):
         # Build content based on effect type
-        if effect["type"] == "drum":
-            self._build_drum_content()
-        elif effect["type"] == "metronome":
-            self._build_metronome_content()
-        elif effect["type"] == "looper":
-            self._build_looper_content()
-        elif effect["type"] == "tuner":
-            self._build_tuner_content()
-        elif effect["type"] == "setup":
-            self._build_setup_content()
+        builder = self.panel_builders.get(effect["type"])
+        if builder is not None:
+            builder(parent)
         else:
-            self._build_regular_effect_content(effect)
+            self._build_regular_effect_content(parent, effect)
 
-    def _build_regular_effect_content(self, effect):
+    def _build_regular_effect_content(self, parent, effect):
         """Build content for regular guitar effects"""
         # Dropdowns if any
         params = effect.get("params", {})
         dropdown_names = params.get("dropdowns", [])
         
         if dropdown_names:
-            dd_frame = tk.Frame(self.scrollable_content, bg=PANEL)
+            dd_frame = tk.Frame(parent, bg=PANEL)
             dd_frame.pack(pady=12)
             
             for dropdown_name in dropdown_names:
                 # Create dropdown with sample values
-                sample_values = ["Option 1", "Option 2", "Option 3", "Option 4"]
+                sample_values = ("Option 1", "Option 2", "Option 3", "Option 4")
                 var = tk.StringVar(value=sample_values[0])
                 
                 tk.Label(dd_frame, text=f"{dropdown_name.title()}:", fg=FG, bg=PANEL,
-                        font=("Segoe UI", 14)).pack(pady=3)
+                        font=UI_FONT).pack(pady=3)
                 
                 combo = ttk.Combobox(dd_frame, textvariable=var,
                                    values=sample_values, state="readonly", width=30,
@@ -564,7 +865,7 @@ class GuitarFXApp(tk.Tk):
         # Effect knobs
         knob_names = params.get("knobs", [])
         if knob_names:
-            knobs_frame = tk.Frame(self.scrollable_content, bg=PANEL)
+            knobs_frame = tk.Frame(parent, bg=PANEL)
             knobs_frame.pack(pady=20)
             
             # Arrange knobs in rows of 3 with tighter spacing
@@ -580,10 +881,10 @@ class GuitarFXApp(tk.Tk):
                 col = i % 3
                 knob.grid(row=row, column=col, padx=20, pady=15)
 
-    def _build_drum_content(self):
+    def _build_drum_content(self, parent):
         """Build drum sequencer content"""
         # Level knob
-        level_frame = tk.Frame(self.scrollable_content, bg=PANEL)
+        level_frame = tk.Frame(parent, bg=PANEL)
         level_frame.pack(pady=15)
         
         self.drum_level_knob = MetallicKnob(level_frame, size=120, min_value=0, max_value=255, label="Level")
@@ -594,12 +895,12 @@ class GuitarFXApp(tk.Tk):
         self.drum_level_knob.set_change_callback(lambda: self._send_drum_data(trigger="Level"))
         
         # Drum controls with tighter spacing
-        controls_frame = tk.Frame(self.scrollable_content, bg=PANEL)
+        controls_frame = tk.Frame(parent, bg=PANEL)
         controls_frame.pack(pady=15, padx=40)
         
         # Style dropdown
         self.drum_style_var = tk.StringVar(value=self.style_options[0])
-        tk.Label(controls_frame, text="Style:", fg=FG, bg=PANEL, font=("Segoe UI", 14)).pack(pady=3)
+        tk.Label(controls_frame, text="Style:", fg=FG, bg=PANEL, font=UI_FONT).pack(pady=3)
         style_dd = ttk.Combobox(controls_frame, textvariable=self.drum_style_var,
                                values=self.style_options, state="readonly", width=30,
                                style="Large.TCombobox")
@@ -607,7 +908,7 @@ class GuitarFXApp(tk.Tk):
         
         # Number dropdown
         self.drum_number_var = tk.StringVar(value=self.number_options[0])
-        tk.Label(controls_frame, text="Number:", fg=FG, bg=PANEL, font=("Segoe UI", 14)).pack(pady=3)
+        tk.Label(controls_frame, text="Number:", fg=FG, bg=PANEL, font=UI_FONT).pack(pady=3)
         number_dd = ttk.Combobox(controls_frame, textvariable=self.drum_number_var,
                                 values=self.number_options, state="readonly", width=30,
                                 style="Large.TCombobox")
@@ -615,18 +916,18 @@ class GuitarFXApp(tk.Tk):
         
         # Fill dropdown
         self.drum_fill_var = tk.StringVar(value=self.fill_options[0])
-        tk.Label(controls_frame, text="Fill:", fg=FG, bg=PANEL, font=("Segoe UI", 14)).pack(pady=3)
+        tk.Label(controls_frame, text="Fill:", fg=FG, bg=PANEL, font=UI_FONT).pack(pady=3)
         fill_dd = ttk.Combobox(controls_frame, textvariable=self.drum_fill_var,
                               values=self.fill_options, state="readonly", width=30,
                               style="Large.TCombobox")
         fill_dd.pack(pady=3)
         
         # Drum pattern grid
-        pattern_frame = tk.Frame(self.scrollable_content, bg=PANEL)
+        pattern_frame = tk.Frame(parent, bg=PANEL)
         pattern_frame.pack(pady=20)
         
         tk.Label(pattern_frame, text="Drum Pattern", fg=ACCENT, bg=PANEL,
-                font=("Segoe UI", 16)).pack(pady=8)
+                font=LARGE_FONT).pack(pady=8)
         
         self._create_drum_pattern_grid(pattern_frame)
         
@@ -636,57 +937,88 @@ class GuitarFXApp(tk.Tk):
         fill_dd.bind("<<ComboboxSelected>>", lambda e: self._handle_drum_style_change(trigger="Fill"))
 
     def _create_drum_pattern_grid(self, parent):
-        grid_frame = tk.Frame(parent, bg=PANEL)
-        grid_frame.pack()
-        
         # Create grid for first 3 drum parts (Kick, Snare, HiHat) and 16 beats
         parts_to_show = ["Kick", "Snare", "HiHat"]
         
+        # The whole grid is drawn on one canvas: a row of beat numbers,
+        # then one row of step cells per drum part
+        label_w = DRUM_LABEL_W
+        cell = DRUM_CELL
+        grid_canvas = tk.Canvas(parent, bg=PANEL, highlightthickness=0,
+                                width=label_w + PATTERN_COLS * cell,
+                                height=(len(parts_to_show) + 1) * cell)
+        grid_canvas.pack()
+        
         # Beat numbers header
-        for col in range(16):
-            lbl = tk.Label(grid_frame, text=str(col+1), bg="#555", fg="#fff",
-                          font=("Segoe UI", 10), width=3, height=1)
-            lbl.grid(row=0, column=col+1, padx=1, pady=1)
+        for col in range(PATTERN_COLS):
+            x = label_w + col * cell
+            grid_canvas.create_rectangle(x, 0, x + cell - 2, cell - 2, fill="#555", outline="")
+            grid_canvas.create_text(x + (cell - 2) / 2, (cell - 2) / 2, text=str(col+1),
+                                    fill="#fff", font=SMALL_FONT)
         
         # Drum pattern grid
-        self.drum_grid = []
+        self.drum_cell_ids = []
+        self.drum_grid_parts = []
         for row, part in enumerate(parts_to_show):
+            y = (row + 1) * cell
             # Part label
-            tk.Label(grid_frame, text=part, bg="#666", fg="#eee",
-                    font=("Segoe UI", 12), width=8, height=2).grid(row=row+1, column=0, padx=2, pady=1)
+            grid_canvas.create_rectangle(0, y, label_w - 4, y + cell - 2, fill="#666", outline="")
+            grid_canvas.create_text((label_w - 4) / 2, y + (cell - 2) / 2, text=part,
+                                    fill="#eee", font=BUTTON_FONT)
             
-            row_buttons = []
-            for col in range(16):
-                # Get actual drum part index
-                part_idx = DRUM_PARTS.index(part) if part in DRUM_PARTS else row
-                state = drum_pattern_array[part_idx][col] if part_idx < len(drum_pattern_array) else 0
-                
-                btn = tk.Button(grid_frame, text="", width=3, height=1,
-                              bg="#0f0" if state else "#333",
-                              command=lambda r=part_idx, c=col: self._toggle_drum_beat(r, c))
-                btn.grid(row=row+1, column=col+1, padx=1, pady=1)
-                row_buttons.append(btn)
-            self.drum_grid.append(row_buttons)
+            # Get actual drum part index and its step mask once per row
+            part_idx = _DRUM_PART_INDEX.get(part, row)
+            row_mask = drum_pattern_array[part_idx] if part_idx < len(drum_pattern_array) else 0
+            
+            row_cells = []
+            for col in range(PATTERN_COLS):
+                state = (row_mask >> col) & 1
+                x = label_w + col * cell
+                item = grid_canvas.create_rectangle(x, y, x + cell - 2, y + cell - 2,
+                                                    fill="#0f0" if state else "#333",
+                                                    outline="#777")
+                row_cells.append(item)
+            self.drum_cell_ids.append(row_cells)
+            self.drum_grid_parts.append(part_idx)
+        
+        grid_canvas.bind("<Button-1>", self._on_drum_grid_click)
+        self.drum_canvas = grid_canvas
+
+    def _on_drum_grid_click(self, event):
+        # Map the click position straight to a cell; the header row is grid row -1
+        # and the label column gives a negative column; _toggle_drum_beat ignores both
+        row = event.y // DRUM_CELL - 1
+        col = (event.x - DRUM_LABEL_W) // DRUM_CELL
+        self._toggle_drum_beat(row, col)
 
     def _toggle_drum_beat(self, row, col):
-        if row < len(drum_pattern_array) and col < len(drum_pattern_array[row]):
-            drum_pattern_array[row][col] = 1 - drum_pattern_array[row][col]
-            
-            # Update button color
-            if row < len(self.drum_grid) and col < len(self.drum_grid[row]):
-                color = "#0f0" if drum_pattern_array[row][col] else "#333"
-                self.drum_grid[row][col].config(bg=color)
-            
-            # Send pattern data
-            self.DrumPatEnab = 1
-            self._send_drmp_pattern()
+        """Toggle a step of grid row ``row``; the pattern is indexed by drum part"""
+        # Nothing changes for a cell outside the pattern, so skip the redraw and send
+        if not (0 <= row < len(self.drum_grid_parts) and 0 <= col < PATTERN_COLS):
+            return
+        
+        part_idx = self.drum_grid_parts[row]
+        drum_pattern_array[part_idx] ^= 1 << col
+        
+        # Update cell color
+        color = "#0f0" if (drum_pattern_array[part_idx] >> col) & 1 else "#333"
+        self.drum_canvas.itemconfig(self.drum_cell_ids[row][col], fill=color)
+        
+        # Send pattern data
+        self.DrumPatEnab = 1
+        if self.drmp_job is None:
+            self.drmp_job = self.after(30, self._flush_drmp)
 
-    def _build_metronome_content(self):
+    def _flush_drmp(self):
+        self.drmp_job = None
+        self._send_drmp_pattern()
+
+    def _build_metronome_content(self, parent):
         """Build metronome content"""
-        tk.Label(self.scrollable_content, text="Metronome Controls", fg=FG, bg=PANEL,
-                font=("Segoe UI", 16)).pack(pady=40)
+        tk.Label(parent, text="Metronome Controls", fg=FG, bg=PANEL,
+                font=LARGE_FONT).pack(pady=40)
         
-        knobs_frame = tk.Frame(self.scrollable_content, bg=PANEL)
+        knobs_frame = tk.Frame(parent, bg=PANEL)
         knobs_frame.pack(pady=15)
         
         vol_knob = MetallicKnob(knobs_frame, size=120, min_value=0, max_value=100, label="Volume")
@@ -697,67 +1029,71 @@ class GuitarFXApp(tk.Tk):
         bpm_knob.pack(side="left", padx=25)
         bpm_knob.set_value(120)
 
-    def _build_looper_content(self):
+    def _build_looper_content(self, parent):
         """Build looper content"""
-        tk.Label(self.scrollable_content, text="Looper Controls", fg=FG, bg=PANEL,
-                font=("Segoe UI", 16)).pack(pady=40)
+        tk.Label(parent, text="Looper Controls", fg=FG, bg=PANEL,
+                font=LARGE_FONT).pack(pady=40)
         
-        controls_frame = tk.Frame(self.scrollable_content, bg=PANEL)
+        controls_frame = tk.Frame(parent, bg=PANEL)
         controls_frame.pack(pady=15)
         
-        record_btn = tk.Button(controls_frame, text="RECORD", bg=RED, fg=FG,
-                              font=("Segoe UI", 14), width=12, height=2)
+        record_btn = tk.Button(controls_frame, text="RECORD", bg=RED, fg=FG, **TRANSPORT_BTN_KW)
         record_btn.pack(pady=8)
         
-        play_btn = tk.Button(controls_frame, text="PLAY", bg=GREEN, fg="#000",
-                            font=("Segoe UI", 14), width=12, height=2)
+        play_btn = tk.Button(controls_frame, text="PLAY", bg=GREEN, fg="#000", **TRANSPORT_BTN_KW)
         play_btn.pack(pady=8)
         
-        stop_btn = tk.Button(controls_frame, text="STOP", bg="#666", fg=FG,
-                            font=("Segoe UI", 14), width=12, height=2)
+        stop_btn = tk.Button(controls_frame, text="STOP", bg="#666", fg=FG, **TRANSPORT_BTN_KW)
         stop_btn.pack(pady=8)
 
-    def _build_tuner_content(self):
+    def _build_tuner_content(self, parent):
         """Build tuner content"""
-        tk.Label(self.scrollable_content, text="Tuner", fg=FG, bg=PANEL,
-                font=("Segoe UI", 16)).pack(pady=40)
+        tk.Label(parent, text="Tuner", fg=FG, bg=PANEL,
+                font=LARGE_FONT).pack(pady=40)
         
-        tuner_display = tk.Frame(self.scrollable_content, bg="#000", width=400, height=200)
+        tuner_display = tk.Frame(parent, bg="#000", width=400, height=200)
         tuner_display.pack(pady=15)
         tuner_display.pack_propagate(False)
         
         tk.Label(tuner_display, text="E", fg=GREEN, bg="#000",
-                font=("Segoe UI", 48)).pack(expand=True)
+                font=DISPLAY_FONT).pack(expand=True)
 
-    def _build_setup_content(self):
+    def _build_setup_content(self, parent):
         """Build setup content"""
-        tk.Label(self.scrollable_content, text="System Setup", fg=FG, bg=PANEL,
-                font=("Segoe UI", 16)).pack(pady=40)
+        tk.Label(parent, text="System Setup", fg=FG, bg=PANEL,
+                font=LARGE_FONT).pack(pady=40)
         
-        setup_frame = tk.Frame(self.scrollable_content, bg=PANEL)
+        setup_frame = tk.Frame(parent, bg=PANEL)
         setup_frame.pack(pady=15, padx=40)
         
         # Input gain
-        tk.Label(setup_frame, text="Input Gain:", fg=FG, bg=PANEL, font=("Segoe UI", 14)).pack(pady=3)
-        gain_combo = ttk.Combobox(setup_frame, values=["Low", "Medium", "High"], state="readonly", width=30)
-        gain_combo.set("Medium")
+        tk.Label(setup_frame, text="Input Gain:", fg=FG, bg=PANEL, font=UI_FONT).pack(pady=3)
+        self.input_gain_var = tk.StringVar(value="Medium")
+        gain_combo = ttk.Combobox(setup_frame, values=("Low", "Medium", "High"),
+                                  textvariable=self.input_gain_var, state="readonly", width=30)
         gain_combo.pack(pady=3)
         
         # Output mode
-        tk.Label(setup_frame, text="Output Mode:", fg=FG, bg=PANEL, font=("Segoe UI", 14)).pack(pady=3)
-        output_combo = ttk.Combobox(setup_frame, values=["Stereo", "Mono", "Headphones"], state="readonly", width=30)
-        output_combo.set("Stereo")
+        tk.Label(setup_frame, text="Output Mode:", fg=FG, bg=PANEL, font=UI_FONT).pack(pady=3)
+        self.output_mode_var = tk.StringVar(value="Stereo")
+        output_combo = ttk.Combobox(setup_frame, values=("Stereo", "Mono", "Headphones"),
+                                    textvariable=self.output_mode_var, state="readonly", width=30)
         output_combo.pack(pady=3)
 
     def _update_effect_buttons(self):
         """Update effect button colors based on selection and enable state"""
         for i, btn in enumerate(self.effect_buttons):
             if i == self.current_effect:
-                btn.config(bg=ACCENT, fg="#000")  # Selected effect
-            elif hasattr(self, 'effect_enables') and i in self.effect_enables and self.effect_enables[i].get():
-                btn.config(bg=GREEN, fg="#000")  # Enabled effect with lighter green
+                colors = (ACCENT, "#000")  # Selected effect
+            elif i in self.effect_enables and self.effect_enables[i].get():
+                colors = (GREEN, "#000")  # Enabled effect with lighter green
             else:
-                btn.config(bg="#555", fg=FG)  # Disabled/normal effect
+                colors = ("#555", FG)  # Disabled/normal effect
+            
+            # Only touch buttons whose colors actually change
+            if self.effect_btn_colors[i] != colors:
+                btn.config(bg=colors[0], fg=colors[1])
+                self.effect_btn_colors[i] = colors
 
     def _on_effect_enable_changed(self, effect_idx):
         """Handle effect enable/disable with proper color update"""
@@ -784,14 +1120,24 @@ class GuitarFXApp(tk.Tk):
         self.status_bar.pack_propagate(False)
         
         self.status_message = tk.StringVar(value="Ready")
+        self.pending_status = None
+        self.status_scheduled = False
         tk.Label(self.status_bar, textvariable=self.status_message,
-                fg=FG, bg=PANEL, font=("Segoe UI", 10)).pack(side="left", padx=8, pady=2)
+                fg=FG, bg=PANEL, font=SMALL_FONT).pack(side="left", padx=8, pady=2)
 
     def _update_status(self, message):
-        if self.winfo_exists():
-            self.status_message.set(message)
+        # Bursts of updates collapse into one label change per idle tick, showing the latest
+        self.pending_status = message
+        if not self.status_scheduled and self._alive:
+            self.status_scheduled = True
+            self.after_idle(self._flush_status)
+        if DEBUG:
             print(f"STATUS: {message}")
 
+    def _flush_status(self):
+        self.status_scheduled = False
+        self.status_message.set(self.pending_status)
+
     # Single toggle connection method
     def _toggle_connection(self):
         if self.bt_connected:
@@ -801,7 +1147,7 @@ class GuitarFXApp(tk.Tk):
 
     def _find_port(self):
         for p in serial.tools.list_ports.comports():
-            if p.description and DEVICE_NAME.upper() in p.description.upper():
+            if p.description and _DEVICE_NAME_UC in p.description.upper():
                 return p.device
         return None
 
@@ -813,27 +1159,42 @@ class GuitarFXApp(tk.Tk):
         self.status_led.itemconfig("led", fill=ORANGE)
         self.status_text.config(text="Connecting...", fg=ORANGE)
         self.btn_connect_toggle.config(text="Connecting...", state="disabled")
-        self.after(100, self._attempt_connection)
+        # Idle callbacks run after the LED/status redraw, so no fixed delay is needed
+        self.after_idle(self._attempt_connection)
 
     def _attempt_connection(self):
+        # Port enumeration and opening can block, so they run off the Tk thread
+        threading.Thread(target=self._open_port_worker, daemon=True).start()
+
+    def _open_port_worker(self):
         try:
             port = self._find_port()
             if not port:
-                self._simulate_connection()  # Demo mode
+                self.after(0, self._simulate_connection)  # Demo mode
                 return
             
-            self.serial_port = serial.Serial(port, 115200, timeout=1)
-            self.bt_connected = True
-            self.is_connecting = False
-            
-            self.status_led.itemconfig("led", fill=GREEN)
-            self.status_text.config(text="Connected", fg=GREEN)
-            self.btn_connect_toggle.config(text="Disconnect", state="normal")
-            
-            self._update_status(f"Connected to {DEVICE_NAME}")
+            # No read timeout: the reader thread blocks until data arrives and
+            # _disconnect wakes it with cancel_read()
+            serial_port = serial.Serial(port, 115200, timeout=None)
+            set_low_latency(serial_port)
             
         except Exception as e:
-            self._simulate_connection()  # Fallback to demo mode
+            self.after(0, self._simulate_connection)  # Fallback to demo mode
+            return
+        
+        self.after(0, self._on_port_opened, serial_port)
+
+    def _on_port_opened(self, serial_port):
+        self.serial_port = serial_port
+        self._start_serial_workers(serial_port)
+        self.bt_connected = True
+        self.is_connecting = False
+        
+        self.status_led.itemconfig("led", fill=GREEN)
+        self.status_text.config(text="Connected", fg=GREEN)
+        self.btn_connect_toggle.config(text="Disconnect", state="normal")
+        
+        self._update_status(f"Connected to {DEVICE_NAME}")
 
     def _simulate_connection(self):
         """Demo mode for testing UI"""
@@ -847,54 +1208,141 @@ class GuitarFXApp(tk.Tk):
         self._update_status("Demo Mode - UI Functional")
 
     def _disconnect(self):
+        if self.send_job is not None:
+            self.after_cancel(self.send_job)
+            self.send_job = None
+        self.pending_send.clear()
+        
+        self.serial_stop.set()
+        if self.tx_queue is not None:
+            self.tx_queue.put(None)  # Stops the writer thread
+            self.tx_queue = None
+        
         if self.serial_port:
             try:
+                # Wake both worker threads out of their blocking read and write
+                if hasattr(self.serial_port, "cancel_read"):
+                    self.serial_port.cancel_read()
+                if hasattr(self.serial_port, "cancel_write"):
+                    self.serial_port.cancel_write()
                 self.serial_port.close()
-            except:
+            except (SerialException, OSError):
                 pass
             self.serial_port = None
         
         self.bt_connected = False
         self.is_connecting = False
         
-        if self.winfo_exists():
+        if self._alive:
             self.status_led.itemconfig("led", fill="#C33")
             self.status_text.config(text="Disconnected", fg="#C33")
             self.btn_connect_toggle.config(text="Connect", state="normal")
             self._update_status("Disconnected")
 
-    # Communication methods (simplified for demo)
+    # Communication methods: packets are queued here and written by the serial workers
     def _send_17_byte_packet(self, data):
         if not self.bt_connected:
             self._update_status("Send Failed: Not connected")
-            return
+            return False
         
+        # A newer packet with the same header replaces one that has not been flushed yet
         packet_name = data[:4].decode('ascii', errors='ignore')
-        self._update_status(f"Sent {packet_name} packet")
+        self.pending_send[packet_name] = bytes(data)
+        if self.send_job is None:
+            self.send_job = self.after(SEND_INTERVAL_MS, self._flush_serial)
+        return True
+
+    def _flush_serial(self):
+        """Write all pending packets to the port in a single call"""
+        self.send_job = None
+        if not self.pending_send:
+            return
+        
+        packets = self.pending_send
+        self.pending_send = {}
+        if self.tx_queue is not None:
+            self.tx_queue.put(b"".join(packets.values()))
+
+    # Serial worker threads; results are handed back to Tk with after()
+    def _start_serial_workers(self, port):
+        self.tx_queue = queue.Queue()
+        self.serial_stop = threading.Event()
+        threading.Thread(target=self._serial_writer, args=(port, self.tx_queue, self.serial_stop),
+                         daemon=True).start()
+        threading.Thread(target=self._serial_reader, args=(port, self.serial_stop),
+                         daemon=True).start()
+
+    def _serial_writer(self, port, tx_queue, stop):
+        """Write queued data so a congested link never blocks the UI"""
+        while True:
+            data = tx_queue.get()
+            if data is None:
+                return
+            try:
+                port.write(data)
+            except (SerialException, OSError, TypeError) as e:
+                # Writes on a port closed by _disconnect fail too; only report real drops
+                if not stop.is_set():
+                    self.after(0, self._update_status, f"Send Failed: {e}")
+                    self.after(0, self._handle_disconnect, port)
+                return
+
+    def _serial_reader(self, port, stop):
+        """Wait for one byte, then drain everything else that has arrived.
+        A failed read is how a dropped link is detected, so nothing polls the port.
+        Nothing parses device replies yet, so the drained bytes are discarded."""
+        while not stop.is_set():
+            try:
+                if port.read(1) and port.in_waiting:
+                    port.read(port.in_waiting)
+            except (SerialException, OSError, TypeError):
+                # Reads on a port closed by _disconnect fail too; only report real drops
+                if not stop.is_set():
+                    self.after(0, self._handle_disconnect, port)
+                return
+
+    def _handle_disconnect(self, port):
+        # Ignore reports from the workers of an earlier connection
+        if port is not self.serial_port:
+            return
+        self._disconnect()
+        self._update_status(f"Connection to {DEVICE_NAME} lost")
 
     def _send_drum_data(self, trigger="unknown"):
         # Show current drum level knob value in status
-        level_value = int(self.drum_level_knob.get_value()) if hasattr(self, 'drum_level_knob') else 127
+        level_value = self.drum_level_knob.int_value if hasattr(self, 'drum_level_knob') else 127
         self._update_status(f"Drum send: {trigger} - Level: {level_value}")
         
     def _send_drmp_pattern(self):
-        self._update_status("DRMP pattern sent")
+        data = DRMP_PACKET.pack(b"DRMP",
+                                drum_pattern_array[_DRUM_PART_INDEX["Snare"]],
+                                drum_pattern_array[_DRUM_PART_INDEX["HiHat"]],
+                                drum_pattern_array[_DRUM_PART_INDEX["Kick"]])
+        if self._send_17_byte_packet(data):
+            self._update_status("DRMP pattern sent")
 
     def _handle_drum_style_change(self, trigger="unknown"):
         self.DrumPatEnab = 0
         self._send_drum_data(trigger=trigger)
 
     # Preset management methods
+    def _index_presets(self):
+        """Build the (bank, num) lookup from the "Bank_Num" keys used on disk"""
+        self.presets_by_tuple = {
+            tuple(key.split("_", 1)): preset
+            for key, preset in self.presets.items()
+            if key != "last_used" and "_" in key
+        }
+
     def _on_preset_changed(self, event=None):
         bank = self.bank_var.get()
         num = self.num_var.get()
-        preset_key = f"{bank}_{num}"
-        preset = self.presets.get(preset_key, None)
+        preset = self.presets_by_tuple.get((bank, num))
         if preset:
             self._apply_preset(preset)
-            self._update_status(f"Loaded preset: {preset_key}")
+            self._update_status(f"Loaded preset: {bank}_{num}")
         else:
-            self._update_status(f"No preset found for: {preset_key}")
+            self._update_status(f"No preset found for: {bank}_{num}")
 
     def _on_update_preset(self):
         bank = self.bank_var.get()
@@ -902,64 +1350,77 @@ class GuitarFXApp(tk.Tk):
         preset_key = f"{bank}_{num}"
         preset_data = self._collect_current_state()
         self.presets[preset_key] = preset_data
+        self.presets_by_tuple[(bank, num)] = preset_data
         self.presets["last_used"] = preset_key
-        self._save_presets()
+        self._schedule_save_presets()
         self._update_status(f"Preset {preset_key} updated")
 
     def _collect_current_state(self):
         # Simplified state collection for demo
         state = {}
         state["perm_knobs"] = {
-            "Master": int(self.perm_knobs["Master"].get_value()),
-            "BPM": int(self.perm_knobs["BPM"].get_value()),
-            "BL_Vol": int(self.perm_knobs["BL_Vol"].get_value())
+            "Master": self.perm_knobs["Master"].int_value,
+            "BPM": self.perm_knobs["BPM"].int_value,
+            "BL_Vol": self.perm_knobs["BL_Vol"].int_value
         }
         return state
 
     def _apply_preset(self, preset):
         # Simplified preset application for demo
         perm = preset.get("perm_knobs", {})
-        if "Master" in self.perm_knobs: 
-            self.perm_knobs["Master"].set_value(perm.get("Master", 50))
-        if "BPM" in self.perm_knobs: 
-            self.perm_knobs["BPM"].set_value(perm.get("BPM", 127))
-        if "BL_Vol" in self.perm_knobs: 
-            self.perm_knobs["BL_Vol"].set_value(perm.get("BL_Vol", 50))
+        for name, default in (("Master", 50), ("BPM", 127), ("BL_Vol", 50)):
+            knob = self.perm_knobs.get(name)
+            value = perm.get(name, default)
+            # Knobs already showing the value are left alone to avoid a redraw
+            if knob is not None and knob.int_value != value:
+                knob.set_value(value)
 
     # State management methods
-    def _load_presets(self):
-        if not os.path.exists(PRESETS_FILE):
-            return {"last_used": None}
+    def _load_json(self, path, default):
+        """Parse a JSON file in one read, returning ``default`` if it is missing or invalid"""
         try:
-            with open(PRESETS_FILE, "r", encoding="utf-8") as f:
-                return json.load(f)
-        except:
+            return json_loads(Path(path).read_bytes())
+        except (OSError, json.JSONDecodeError, UnicodeDecodeError):
+            return default
+
+    def _load_presets(self):
+        presets = self._load_json(PRESETS_FILE, None)
+        # _index_presets walks the keys at startup, so anything but an object is ignored
+        if not isinstance(presets, dict):
             return {"last_used": None}
+        return presets
+
+    def _schedule_save_presets(self):
+        """Save presets once, 500 ms after the last of a burst of updates"""
+        if self.save_presets_job is not None:
+            self.after_cancel(self.save_presets_job)
+        self.save_presets_job = self.after(500, self._flush_presets)
+
+    def _flush_presets(self):
+        self.save_presets_job = None
+        self._save_presets()
 
     def _save_presets(self):
         try:
-            with open(PRESETS_FILE, "w", encoding="utf-8") as f:
-                json.dump(self.presets, f, indent=2)
+            write_json_atomic(PRESETS_FILE, self.presets)
         except Exception as e:
             print(f"Error saving presets: {e}")
 
     def _load_state(self):
-        if not os.path.exists(STATE_FILE):
-            return {}
-        try:
-            with open(STATE_FILE, "r", encoding="utf-8") as f:
-                return json.load(f)
-        except:
-            return {}
+        return self._load_json(STATE_FILE, {})
 
     def _save_state(self):
         try:
-            with open(STATE_FILE, "w", encoding="utf-8") as f:
-                json.dump(self.tab_state, f, indent=2)
+            write_json_atomic(STATE_FILE, self.tab_state)
         except Exception as e:
             print("Could not save state:", e)
 
     def _on_close(self):
+        self._alive = False
+        # Write out a preset save that is still waiting on its debounce timer
+        if self.save_presets_job is not None:
+            self.after_cancel(self.save_presets_job)
+            self._flush_presets()
         self._save_state()
         self._disconnect()
         self.destroy()